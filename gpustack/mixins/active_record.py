@@ -1,41 +1,97 @@
+import asyncio
 from datetime import datetime, timezone
 import importlib
-import json
 import logging
-import math
-from typing import Any, AsyncGenerator, Optional, Union, overload
-
-from fastapi.encoders import jsonable_encoder
-from sqlalchemy import func
+import operator
+from typing import (
+    Any,
+    AsyncGenerator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    overload,
+)
+
+from pydantic import TypeAdapter
+from sqlalchemy import ColumnElement, bindparam, delete, func, inspect, true, tuple_
+from sqlalchemy import select as sa_select
 from sqlmodel import SQLModel, and_, col, or_, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlalchemy.exc import IntegrityError, OperationalError
+from sqlalchemy.orm import noload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.orm.exc import FlushError
 from sqlalchemy.ext.asyncio import AsyncEngine
-from gpustack.schemas.common import PaginatedList, Pagination
+from gpustack.schemas.common import (
+    CursorPaginatedList,
+    CursorPagination,
+    PaginatedList,
+    Pagination,
+)
 from gpustack.server.bus import Event, EventType, event_bus
 
 
 logger = logging.getLogger(__name__)
 
+# Serializer for streamed events, built once and backed by pydantic-core.
+_event_adapter = TypeAdapter(Event)
+
+
+def _fuzzy_value(getter: operator.attrgetter, obj: Any) -> str:
+    """Return the attribute as a string, or an empty string if it's missing."""
+
+    try:
+        return str(getter(obj))
+    except AttributeError:
+        return ""
+
 
 class ActiveRecordMixin:
-    """ActiveRecordMixin provides a set of methods to interact with the database."""
+    """
+    ActiveRecordMixin provides a set of methods to interact with the database.
+
+    Lazy loading a relationship inside an async session raises MissingGreenlet
+    and costs one query per object. The by_field helpers take a load argument
+    naming the relationships to eager load with selectinload, e.g.
+    `await Model.all_by_field(session, "name", name, load=["instances"])`.
+    """
 
     __config__ = None
 
+    # Fetch server generated values, e.g. timestamps, with RETURNING on flush.
+    __mapper_args__ = {"eager_defaults": True}
+
+    # Fetch the total count along with the page in paginated_by_query using
+    # a COUNT(*) OVER () window function. Set to False to use a separate
+    # count query on engines where the window aggregate is expensive.
+    __window_count__ = True
+
     @property
     def primary_key(self):
         """Return the primary key of the object."""
 
-        return self.__mapper__.primary_key_from_instance(self)
+        return tuple(getattr(self, name) for name in self._primary_key_names())
+
+    @classmethod
+    def _primary_key_names(cls) -> List[str]:
+        """Return the attribute names of the primary key columns of the model."""
+
+        # Look up the class's own __dict__ so that every model caches its own names.
+        names = cls.__dict__.get("__primary_key_names__")
+        if names is None:
+            mapper = cls.__mapper__
+            names = [mapper.get_property_by_column(c).key for c in mapper.primary_key]
+            cls.__primary_key_names__ = names
+        return names
 
     @classmethod
     async def first(cls, session: AsyncSession):
         """Return the first object of the model."""
 
-        statement = select(cls)
-        result = await session.exec(statement)
+        statement, params = cls._select_by_fields({}, limit=1)
+        result = await session.exec(statement, params=params)
         return result.first()
 
     @classmethod
@@ -45,65 +101,188 @@ class ActiveRecordMixin:
         return await session.get(cls, id)
 
     @classmethod
-    async def first_by_field(cls, session: AsyncSession, field: str, value: Any):
+    def _select(cls, columns: Optional[Sequence[str]] = None, load: Sequence[str] = ()):
+        """
+        Return a select statement for the model.
+        If columns are given, only those columns are selected and the statement
+        yields rows instead of model objects.
+        Relationships named in load are eager loaded with selectinload.
+        """
+
+        if columns:
+            return sa_select(*[getattr(cls, column) for column in columns])
+
+        statement = select(cls)
+        for name in load:
+            statement = statement.options(selectinload(getattr(cls, name)))
+        return statement
+
+    @classmethod
+    def _select_by_fields(
+        cls,
+        fields: dict,
+        columns: Optional[Sequence[str]] = None,
+        load: Sequence[str] = (),
+        limit: Optional[int] = None,
+    ) -> Tuple[Any, dict]:
+        """
+        Return a select statement filtered by the given fields and its parameters.
+        Plain selects are built once per model and set of fields with the values
+        as bound parameters, so they are not reconstructed on every call.
+        """
+
+        if columns or load or any(value is None for value in fields.values()):
+            # Comparing with None needs IS NULL, build these statements each time.
+            statement = cls._select(columns, load)
+            for key, value in fields.items():
+                statement = statement.where(getattr(cls, key) == value)
+            if limit is not None:
+                statement = statement.limit(limit)
+            return statement, {}
+
+        # Look up the class's own __dict__ so that every model caches its own statements.
+        cache = cls.__dict__.get("__select_statements__")
+        if cache is None:
+            cache = {}
+            cls.__select_statements__ = cache
+
+        cache_key = (tuple(fields), limit)
+        statement = cache.get(cache_key)
+        if statement is None:
+            statement = select(cls).where(
+                *[getattr(cls, key) == bindparam(key) for key in fields]
+            )
+            if limit is not None:
+                statement = statement.limit(limit)
+            cache[cache_key] = statement
+        return statement, fields
+
+    @classmethod
+    async def first_by_field(
+        cls,
+        session: AsyncSession,
+        field: str,
+        value: Any,
+        columns: Optional[Sequence[str]] = None,
+        load: Sequence[str] = (),
+    ):
         """Return the first object with the given field and value. Return None if not found."""
 
-        return await cls.first_by_fields(session, {field: value})
+        return await cls.first_by_fields(
+            session, {field: value}, columns=columns, load=load
+        )
 
     @classmethod
-    async def one_by_field(cls, session: AsyncSession, field: str, value: Any):
+    async def one_by_field(
+        cls,
+        session: AsyncSession,
+        field: str,
+        value: Any,
+        columns: Optional[Sequence[str]] = None,
+        load: Sequence[str] = (),
+    ):
         """Return the object with the given field and value. Return None if not found."""
 
-        return await cls.one_by_fields(session, {field: value})
+        return await cls.one_by_fields(
+            session, {field: value}, columns=columns, load=load
+        )
 
     @classmethod
-    async def first_by_fields(cls, session: AsyncSession, fields: dict):
+    async def first_by_fields(
+        cls,
+        session: AsyncSession,
+        fields: dict,
+        columns: Optional[Sequence[str]] = None,
+        load: Sequence[str] = (),
+    ):
         """
         Return the first object with the given fields and values.
         Return None if not found.
         """
 
-        statement = select(cls)
-        for key, value in fields.items():
-            statement = statement.where(getattr(cls, key) == value)
-
-        result = await session.exec(statement)
+        statement, params = cls._select_by_fields(fields, columns, load, limit=1)
+        result = await session.exec(statement, params=params)
         return result.first()
 
     @classmethod
-    async def one_by_fields(cls, session: AsyncSession, fields: dict):
+    async def one_by_fields(
+        cls,
+        session: AsyncSession,
+        fields: dict,
+        columns: Optional[Sequence[str]] = None,
+        load: Sequence[str] = (),
+    ):
         """Return the object with the given fields and values. Return None if not found."""
 
-        statement = select(cls)
-        for key, value in fields.items():
-            statement = statement.where(getattr(cls, key) == value)
-
-        result = await session.exec(statement)
-        return result.first()
+        # Fetch a second row only to detect fields that are not unique.
+        statement, params = cls._select_by_fields(fields, columns, load, limit=2)
+        result = await session.exec(statement, params=params)
+        items = result.all()
+        if len(items) > 1:
+            logger.warning(
+                f"Multiple {cls.__name__} objects match {list(fields)}, "
+                "returning the first one."
+            )
+        return items[0] if items else None
 
     @classmethod
-    async def all_by_field(cls, session: AsyncSession, field: str, value: Any):
+    async def all_by_field(
+        cls,
+        session: AsyncSession,
+        field: str,
+        value: Any,
+        columns: Optional[Sequence[str]] = None,
+        load: Sequence[str] = (),
+    ):
         """
         Return all objects with the given field and value.
         Return an empty list if not found.
         """
-        statement = select(cls).where(getattr(cls, field) == value)
-        result = await session.exec(statement)
+        statement, params = cls._select_by_fields({field: value}, columns, load)
+        result = await session.exec(statement, params=params)
         return result.all()
 
     @classmethod
-    async def all_by_fields(cls, session: AsyncSession, fields: dict):
+    async def all_by_fields(
+        cls,
+        session: AsyncSession,
+        fields: dict,
+        columns: Optional[Sequence[str]] = None,
+        load: Sequence[str] = (),
+    ):
         """
         Return all objects with the given fields and values.
         Return an empty list if not found.
         """
 
-        statement = select(cls)
-        for key, value in fields.items():
-            statement = statement.where(getattr(cls, key) == value)
-        result = await session.exec(statement)
+        statement, params = cls._select_by_fields(fields, columns, load)
+        result = await session.exec(statement, params=params)
         return result.all()
 
+    @classmethod
+    def _query_conditions(
+        cls, fields: Optional[dict] = None, fuzzy_fields: Optional[dict] = None
+    ) -> list:
+        """
+        Build the where clauses for the given fields and fuzzy fields.
+        Fields are combined with AND, fuzzy fields are combined with OR.
+        """
+
+        conditions = []
+        if fields:
+            conditions.extend(
+                col(getattr(cls, key)) == value for key, value in fields.items()
+            )
+
+        if fuzzy_fields:
+            fuzzy_conditions = [
+                col(getattr(cls, key)).like(f"%{value}%")
+                for key, value in fuzzy_fields.items()
+            ]
+            conditions.append(or_(*fuzzy_conditions))
+
+        return conditions
+
     @classmethod
     async def paginated_by_query(
         cls,
@@ -118,40 +297,49 @@ class ActiveRecordMixin:
         Return an empty list if not found.
         """
 
-        statement = select(cls)
-        if fields:
-            conditions = [
-                col(getattr(cls, key)) == value for key, value in fields.items()
-            ]
-            statement = statement.where(and_(*conditions))
+        conditions = cls._query_conditions(fields, fuzzy_fields)
 
-        if fuzzy_fields:
-            fuzzy_conditions = [
-                col(getattr(cls, key)).like(f"%{value}%")
-                for key, value in fuzzy_fields.items()
-            ]
-            statement = statement.where(or_(*fuzzy_conditions))
+        paginated = page is not None and per_page is not None
+        if cls.__window_count__ and paginated:
+            statement = select(cls, func.count().over().label("total"))
+        else:
+            statement = select(cls)
+        statement = statement.where(*conditions).order_by(cls.id)
 
-        if page is not None and per_page is not None:
+        if paginated:
             statement = statement.offset((page - 1) * per_page).limit(per_page)
-        items = (await session.exec(statement)).all()
 
-        count_statement = select(func.count(cls.id))
-        if fields:
-            conditions = [
-                col(getattr(cls, key)) == value for key, value in fields.items()
-            ]
-            count_statement = count_statement.where(and_(*conditions))
+        count = None
+        count_statement = select(func.count()).select_from(cls).where(*conditions)
+        if not paginated:
+            # All matching objects are returned, so they are the count.
+            items = (await session.exec(statement)).all()
+            count = len(items)
+            page, per_page = 1, count
+        elif cls.__window_count__:
+            rows = (await session.exec(statement)).all()
+            items = [row[0] for row in rows]
+            if rows:
+                count = rows[0][1]
+            elif page <= 1 and per_page > 0:
+                count = 0
+            # Otherwise the page is out of range or empty and the window
+            # count is unavailable, fall back to the count query below.
+        elif session.bind is not None:
+            # Run the count over a second pooled connection alongside the page.
+            async with AsyncSession(session.bind) as count_session:
+                items, count = await asyncio.gather(
+                    session.exec(statement), count_session.exec(count_statement)
+                )
+            items = items.all()
+            count = count.one()
+        else:
+            items = (await session.exec(statement)).all()
 
-        if fuzzy_fields:
-            fuzzy_conditions = [
-                col(getattr(cls, key)).like(f"%{value}%")
-                for key, value in fuzzy_fields.items()
-            ]
-            count_statement = count_statement.where(or_(*fuzzy_conditions))
+        if count is None:
+            count = (await session.exec(count_statement)).one()
 
-        count = (await session.exec(count_statement)).one()
-        total_page = math.ceil(count / per_page)
+        total_page = (count + per_page - 1) // per_page if per_page else 0
         pagination = Pagination(
             page=page,
             perPage=per_page,
@@ -161,6 +349,47 @@ class ActiveRecordMixin:
 
         return PaginatedList[cls](items=items, pagination=pagination)
 
+    @classmethod
+    async def paginated_by_cursor(
+        cls,
+        session: AsyncSession,
+        fields: Optional[dict] = None,
+        fuzzy_fields: Optional[dict] = None,
+        after: Optional[Any] = None,
+        per_page: int = 100,
+    ) -> CursorPaginatedList[SQLModel]:
+        """
+        Return a keyset paginated list of objects match the given fields and values.
+        Objects are ordered by id, starting right after the given cursor.
+        Return an empty list if not found.
+        """
+
+        if per_page < 1:
+            raise ValueError("per_page must be a positive integer.")
+
+        conditions = cls._query_conditions(fields, fuzzy_fields)
+        statement = select(cls).where(*conditions).order_by(cls.id)
+
+        if after is not None:
+            statement = statement.where(cls.id > after)
+
+        # Fetch one extra row to tell whether there is a next page.
+        statement = statement.limit(per_page + 1)
+        items = list((await session.exec(statement)).all())
+
+        has_next = len(items) > per_page
+        if has_next:
+            items.pop()
+        next_cursor = items[-1].id if has_next else None
+
+        pagination = CursorPagination(
+            perPage=per_page,
+            nextCursor=next_cursor,
+            hasNext=has_next,
+        )
+
+        return CursorPaginatedList[cls](items=items, pagination=pagination)
+
     @classmethod
     def convert_without_saving(
         cls, source: Union[dict, SQLModel], update: Optional[dict] = None
@@ -171,9 +400,9 @@ class ActiveRecordMixin:
         """
 
         if isinstance(source, SQLModel):
-            obj = cls.from_orm(source, update=update)
+            obj = cls.model_validate(source, update=update, from_attributes=True)
         elif isinstance(source, dict):
-            obj = cls.parse_obj(source, update=update)
+            obj = cls.model_validate(source, update=update)
         return obj
 
     @classmethod
@@ -193,6 +422,45 @@ class ActiveRecordMixin:
         await cls._publish_event(EventType.CREATED, obj)
         return obj
 
+    @classmethod
+    async def bulk_create(
+        cls,
+        session: AsyncSession,
+        sources: List[Union[dict, SQLModel]],
+    ) -> List[SQLModel]:
+        """
+        Create and save new records for the model in a single transaction.
+        The objects are inserted in one flush and reloaded with one query.
+        """
+
+        objs = [cls.convert_without_saving(source) for source in sources]
+        if not objs:
+            return []
+
+        session.add_all(objs)
+        try:
+            await session.flush()
+            ids = [obj.id for obj in objs]
+            await session.commit()
+        except (IntegrityError, OperationalError, FlushError) as e:
+            await session.rollback()
+            raise e
+
+        # Reload the expired objects in one round-trip instead of refreshing
+        # them one by one.
+        statement = (
+            select(cls)
+            .where(col(cls.id).in_(ids))
+            .execution_options(populate_existing=True)
+        )
+        (await session.exec(statement)).all()
+
+        await asyncio.gather(
+            *[cls._publish_event(EventType.CREATED, obj) for obj in objs],
+            return_exceptions=True,
+        )
+        return objs
+
     @classmethod
     async def create_or_update(
         cls,
@@ -205,9 +473,9 @@ class ActiveRecordMixin:
         obj = cls.convert_without_saving(source, update)
         if obj is None:
             return None
-        pk = cls.__mapper__.primary_key_from_instance(obj)
+        pk = obj.primary_key
         if pk[0] is not None:
-            existing = await session.get(cls, pk)
+            existing = await session.get(cls, pk[0] if len(pk) == 1 else pk)
             if existing is None:
                 return None
             else:
@@ -220,20 +488,46 @@ class ActiveRecordMixin:
     async def count(cls, session: AsyncSession) -> int:
         """Return the number of records in the model."""
 
-        return len(await cls.all(session))
+        statement = select(func.count()).select_from(cls)
+        return (await session.exec(statement)).one()
 
     async def refresh(self, session: AsyncSession):
         """Refresh the object from the database."""
 
         await session.refresh(self)
 
-    async def save(self, session: AsyncSession):
-        """Save the object to the database. Raise exception if failed."""
+    async def save(self, session: AsyncSession, refresh: bool = False):
+        """
+        Save the object to the database. Raise exception if failed.
+        A new object gets its server generated values from the flush with
+        RETURNING, so it's only reloaded if refresh is True, e.g. to load
+        relationships. An existing object is always reloaded, which converts
+        assigned values to their column types and reloads relationships.
+        """
 
+        state = inspect(self)
+        inserting = not state.has_identity
         session.add(self)
         try:
+            await session.flush()
+
+            # The commit expires every object in the session. Restore the
+            # flushed columns of a new object afterwards instead of reloading
+            # it, other objects are still expired as usual.
+            loaded = {}
+            if inserting and not refresh:
+                loaded = {
+                    attr.key: state.dict[attr.key]
+                    for attr in state.mapper.column_attrs
+                    if attr.key in state.dict
+                }
             await session.commit()
-            await session.refresh(self)
+
+            if inserting and not refresh:
+                for key, value in loaded.items():
+                    set_committed_value(self, key, value)
+            else:
+                await session.refresh(self)
         except (IntegrityError, OperationalError, FlushError) as e:
             await session.rollback()
             raise e
@@ -244,7 +538,9 @@ class ActiveRecordMixin:
         """Update the object with the source and save to the database."""
 
         if isinstance(source, SQLModel):
-            source = source.model_dump(exclude_unset=True)
+            # Take the attributes as they are, model_dump would turn nested
+            # models and enums into plain dicts and strings.
+            source = {key: getattr(source, key) for key in source.model_fields_set}
         elif source is None:
             source = {}
 
@@ -256,30 +552,50 @@ class ActiveRecordMixin:
     async def delete(self, session: AsyncSession):
         """Delete the object from the database."""
 
+        deleted = []
         if self._has_cascade_delete():
             if hasattr(self, "deleted_at"):
                 self.deleted_at = datetime.now(timezone.utc)
                 await self.save(session)
-            await self._handle_cascade_delete(session)
+            deleted = await self._handle_cascade_delete(session)
 
         await session.delete(self)
         await session.commit()
-        await self._publish_event(EventType.DELETED, self)
 
-    async def _handle_cascade_delete(self, session: AsyncSession):
-        """Handle cascading deletes for all defined relationships."""
-        for rel in self.__mapper__.relationships:
+        await asyncio.gather(
+            *[
+                model_cls._publish_event(EventType.DELETED, obj)
+                for model_cls, obj in deleted
+            ],
+            self._publish_event(EventType.DELETED, self),
+            return_exceptions=True,
+        )
+
+    async def _handle_cascade_delete(
+        self, session: AsyncSession
+    ) -> List[Tuple[type, SQLModel]]:
+        """
+        Handle cascading deletes for all defined relationships.
+        Related objects are deleted in bulk without committing.
+        Return the deleted objects along with their model class.
+        """
+
+        mapper = self.__mapper__
+        condition = and_(
+            *[
+                column == value
+                for column, value in zip(mapper.primary_key, self.primary_key)
+            ]
+        )
+        deleted = await type(self)._bulk_delete_cascades(session, condition)
+
+        # The related rows are gone, reset the loaded relationships so that
+        # session.delete(self) does not cascade to them again.
+        for rel in mapper.relationships:
             if rel.cascade.delete:
-                # Load the related objects
-                await session.refresh(self)
-                related_objects = getattr(self, rel.key)
+                set_committed_value(self, rel.key, [] if rel.uselist else None)
 
-                # Delete each related object
-                if isinstance(related_objects, list):
-                    for related_object in related_objects:
-                        await related_object.delete(session)
-                elif related_objects:
-                    await related_objects.delete(session)
+        return deleted
 
     def _has_cascade_delete(self):
         """Check if the model has cascade delete relationships."""
@@ -294,11 +610,74 @@ class ActiveRecordMixin:
 
     @classmethod
     async def delete_all(cls, session: AsyncSession):
-        """Delete all objects of the model."""
+        """
+        Delete all objects of the model with bulk DELETE statements.
+        Cascading relationships are deleted in bulk as well.
+        """
 
-        for obj in await cls.all(session):
-            await obj.delete(session)
-            await cls._publish_event(EventType.DELETED, obj)
+        try:
+            deleted = await cls._bulk_delete(session, true())
+            await session.commit()
+        except (IntegrityError, OperationalError) as e:
+            await session.rollback()
+            raise e
+
+        await asyncio.gather(
+            *[
+                model_cls._publish_event(EventType.DELETED, obj)
+                for model_cls, obj in deleted
+            ],
+            return_exceptions=True,
+        )
+
+    @classmethod
+    async def _bulk_delete(
+        cls, session: AsyncSession, condition: ColumnElement[bool]
+    ) -> List[Tuple[type, SQLModel]]:
+        """
+        Delete the rows matching the condition without committing.
+        Rows of cascading relationships are deleted first.
+        Return the deleted objects along with their model class.
+        """
+
+        deleted = await cls._bulk_delete_cascades(session, condition)
+
+        statement = delete(cls).where(condition).returning(cls).options(noload("*"))
+        result = await session.exec(statement)
+        for obj in result.scalars().all():
+            # Detach so the deleted object keeps its loaded state after commit.
+            session.expunge(obj)
+            deleted.append((cls, obj))
+        return deleted
+
+    @classmethod
+    async def _bulk_delete_cascades(
+        cls, session: AsyncSession, condition: ColumnElement[bool]
+    ) -> List[Tuple[type, SQLModel]]:
+        """
+        Delete the rows of cascading relationships for the rows matching the
+        condition without committing, one statement per relationship.
+        Return the deleted objects along with their model class.
+        """
+
+        deleted = []
+        for rel in cls.__mapper__.relationships:
+            if not rel.cascade.delete:
+                continue
+
+            child_cls = rel.mapper.class_
+            local_columns, remote_columns = zip(*rel.local_remote_pairs)
+            if len(remote_columns) == 1:
+                child_condition = remote_columns[0].in_(
+                    select(local_columns[0]).where(condition)
+                )
+            else:
+                # Match composite keys as a whole rather than column by column.
+                child_condition = tuple_(*remote_columns).in_(
+                    select(*local_columns).where(condition)
+                )
+            deleted.extend(await child_cls._bulk_delete(session, child_condition))
+        return deleted
 
     @classmethod
     async def _publish_event(cls, event_type: str, data: Any):
@@ -312,41 +691,96 @@ class ActiveRecordMixin:
     @overload
     @classmethod
     async def subscribe(
-        cls, session_or_engine: AsyncEngine
+        cls, session_or_engine: AsyncEngine, fields: Optional[dict] = None
     ) -> AsyncGenerator[Event, None]: ...
 
     @overload
     @classmethod
     async def subscribe(
-        cls, session_or_engine: AsyncEngine
+        cls, session_or_engine: AsyncEngine, fields: Optional[dict] = None
     ) -> AsyncGenerator[Event, None]: ...
 
     @classmethod
     async def subscribe(
-        cls, session_or_engine: Union[AsyncSession, AsyncEngine]
+        cls,
+        session_or_engine: Union[AsyncSession, AsyncEngine],
+        fields: Optional[dict] = None,
     ) -> AsyncGenerator[Event, None]:
-        if isinstance(session_or_engine, AsyncSession):
-            items = await cls.all(session_or_engine)
-            for item in items:
-                yield Event(type=EventType.CREATED, data=item)
-            await session_or_engine.close()
-        elif isinstance(session_or_engine, AsyncEngine):
-            async with AsyncSession(session_or_engine) as session:
-                items = await cls.all(session)
-                for item in items:
-                    yield Event(type=EventType.CREATED, data=item)
-        else:
+        """
+        Yield the current objects as CREATED events, then the live events.
+        If fields are given, only objects matching all of them are yielded.
+        If events were dropped for falling behind, a RESYNC event is yielded
+        and the current objects are yielded again as CREATED events. Objects
+        deleted meanwhile are not reported, so consumers should reset the
+        state they keep on RESYNC.
+        """
+
+        if not isinstance(session_or_engine, (AsyncSession, AsyncEngine)):
             raise ValueError("Invalid session or engine.")
 
-        subscriber = event_bus.subscribe(cls.__name__.lower())
+        # Subscribe before loading the current objects, so that events published
+        # meanwhile are buffered by the subscriber instead of being lost.
+        fields = fields or {}
+        subscriber = event_bus.subscribe(cls.__name__.lower(), fields)
 
         try:
+            async for item in cls._snapshot(session_or_engine, fields):
+                yield Event(type=EventType.CREATED, data=item)
+
             while True:
                 event = await subscriber.receive()
                 yield event
+
+                if event.type == EventType.RESYNC:
+                    # Events were dropped since we fell behind, reload the
+                    # current objects instead.
+                    async for item in cls._snapshot(session_or_engine, fields):
+                        yield Event(type=EventType.CREATED, data=item)
         finally:
             event_bus.unsubscribe(cls.__name__.lower(), subscriber)
 
+    @classmethod
+    async def _snapshot(
+        cls, session_or_engine: Union[AsyncSession, AsyncEngine], fields: dict
+    ) -> AsyncGenerator[SQLModel, None]:
+        """
+        Yield the current objects matching the given fields.
+        A given session is closed afterwards, an engine gets its own session.
+        """
+
+        if isinstance(session_or_engine, AsyncSession):
+            async for item in cls._iter_by_fields(session_or_engine, fields):
+                yield item
+            await session_or_engine.close()
+        else:
+            async with AsyncSession(session_or_engine) as session:
+                async for item in cls._iter_by_fields(session, fields):
+                    yield item
+
+    @classmethod
+    async def _iter_by_fields(
+        cls, session: AsyncSession, fields: dict, batch_size: int = 500
+    ) -> AsyncGenerator[SQLModel, None]:
+        """
+        Yield the objects matching the given fields in id order.
+        Objects are loaded in keyset paginated batches, so no cursor is held open
+        while the caller consumes them and memory is bounded by the batch size.
+        """
+
+        after = None
+        while True:
+            page = await cls.paginated_by_cursor(
+                session, fields=fields, after=after, per_page=batch_size
+            )
+            for item in page.items:
+                yield item
+
+            if not page.pagination.hasNext:
+                break
+            after = page.pagination.nextCursor
+            # Let other tasks run between batches.
+            await asyncio.sleep(0)
+
     @classmethod
     async def streaming(
         cls,
@@ -354,30 +788,29 @@ class ActiveRecordMixin:
         fields: Optional[dict] = None,
         fuzzy_fields: Optional[dict] = None,
     ) -> AsyncGenerator[str, None]:
-        async for event in cls.subscribe(session):
-            skip_event = False
-
-            # Check fields using AND condition
-            for key, value in (fields or {}).items():
-                if getattr(event.data, key) != value:
-                    skip_event = True
-                    break
-            if skip_event:
+        # Convert the current instance to the corresponding Public class if exists
+        class_module = importlib.import_module(cls.__module__)
+        public_class = getattr(class_module, f"{cls.__name__}Public", None)
+
+        fuzzy_getters = [
+            (operator.attrgetter(key), value)
+            for key, value in (fuzzy_fields or {}).items()
+        ]
+
+        # Fields are matched by the event bus before events are enqueued
+        async for event in cls.subscribe(session, fields):
+            if event.type == EventType.RESYNC:
+                # Clients only get the replayed objects that follow.
                 continue
 
             # Check fuzzy_fields using OR condition
-            fuzzy_match = False
-            for key, value in (fuzzy_fields or {}).items():
-                if value in str(getattr(event.data, key, "")):
-                    fuzzy_match = True
-                    break
-            if fuzzy_fields and not fuzzy_match:
+            if fuzzy_getters and not any(
+                value in _fuzzy_value(getter, event.data)
+                for getter, value in fuzzy_getters
+            ):
                 continue
 
-            # Convert the current instance to the corresponding Public class if exists
-            class_module = importlib.import_module(cls.__module__)
-            public_class = getattr(class_module, f"{cls.__name__}Public", None)
             if public_class:
                 event.data = public_class.model_validate(event.data)
 
-            yield json.dumps(jsonable_encoder(event), separators=(",", ":")) + "\n\n"
+            yield _event_adapter.dump_json(event).decode() + "\n\n"
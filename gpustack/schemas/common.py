@@ -1,6 +1,6 @@
 from datetime import timezone
 import json
-from typing import Generic, Type, TypeVar
+from typing import Any, Generic, Optional, Type, TypeVar
 
 from fastapi import Query
 from fastapi.encoders import jsonable_encoder
@@ -18,6 +18,12 @@ class Pagination(BaseModel):
     totalPage: int
 
 
+class CursorPagination(BaseModel):
+    perPage: int
+    nextCursor: Optional[Any] = None
+    hasNext: bool
+
+
 class ListParams(BaseModel):
     page: int = Query(default=1, ge=1)
     perPage: int = Query(default=100, ge=1, le=100)
@@ -29,6 +35,11 @@ class PaginatedList(BaseModel, Generic[T]):
     pagination: Pagination
 
 
+class CursorPaginatedList(BaseModel, Generic[T]):
+    items: list[T]
+    pagination: CursorPagination
+
+
 class JSON(SQLAlchemyJSON):
     pass
 
@@ -1,8 +1,9 @@
 import asyncio
 from dataclasses import dataclass
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from enum import Enum
 import copy
+import operator
 
 
 class EventType(Enum):
@@ -10,6 +11,9 @@ class EventType(Enum):
     UPDATED = 2
     DELETED = 3
     UNKNOWN = 4
+    # Sent to a subscriber whose queue overflowed, its pending events are
+    # dropped and its state should be reloaded.
+    RESYNC = 5
 
 
 @dataclass
@@ -29,11 +33,28 @@ def event_decoder(obj):
 
 
 class Subscriber:
-    def __init__(self):
-        self.queue = asyncio.Queue()
+    def __init__(self, fields: Optional[Dict[str, Any]] = None, maxsize: int = 1024):
+        self.queue = asyncio.Queue(maxsize)
+        self.fields = [
+            (operator.attrgetter(key), value) for key, value in (fields or {}).items()
+        ]
+
+    def matches(self, event: Event) -> bool:
+        try:
+            return all(getter(event.data) == value for getter, value in self.fields)
+        except AttributeError:
+            return False
 
     async def enqueue(self, event: Event):
-        await self.queue.put(event)
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Never block publishers on a slow subscriber. Drop the pending
+            # events and ask the subscriber to reload its state instead, the
+            # reload covers this event as well.
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(Event(type=EventType.RESYNC, data=None))
 
     async def receive(self) -> Any:
         return await self.queue.get()
@@ -43,8 +64,10 @@ class EventBus:
     def __init__(self):
         self.subscribers: Dict[str, List[Subscriber]] = {}
 
-    def subscribe(self, topic: str) -> Subscriber:
-        subscriber = Subscriber()
+    def subscribe(
+        self, topic: str, fields: Optional[Dict[str, Any]] = None, maxsize: int = 1024
+    ) -> Subscriber:
+        subscriber = Subscriber(fields, maxsize)
         if topic not in self.subscribers:
             self.subscribers[topic] = []
         self.subscribers[topic].append(subscriber)
@@ -59,7 +82,8 @@ class EventBus:
     async def publish(self, topic: str, event: Event):
         if topic in self.subscribers:
             for subscriber in self.subscribers[topic]:
-                await subscriber.enqueue(copy.deepcopy(event))
+                if subscriber.matches(event):
+                    await subscriber.enqueue(copy.deepcopy(event))
 
 
 event_bus = EventBus()
@@ -27,6 +27,10 @@ class ModelController:
         """
 
         async for event in Model.subscribe(self._engine):
+            if event.type == EventType.RESYNC:
+                # The current models are replayed as CREATED events.
+                continue
+
             await self._reconcile(event)
 
     async def _reconcile(self, event: Event):
@@ -53,8 +57,31 @@ class ModelInstanceController:
         """
 
         async for event in ModelInstance.subscribe(self._engine):
+            if event.type == EventType.RESYNC:
+                await self._resync()
+                continue
+
             await self._reconcile(event)
 
+    async def _resync(self):
+        """
+        Reconcile all models, deleted model instances may have been missed.
+        """
+
+        try:
+            async with AsyncSession(self._engine) as session:
+                model_ids = [model.id for model in await Model.all(session)]
+                for model_id in model_ids:
+                    model = await Model.one_by_id(session, model_id)
+                    if not model:
+                        continue
+
+                    await sync_replicas(session, model)
+                    await model.refresh(session)
+                    await sync_ready_replicas(session, model)
+        except Exception as e:
+            logger.error(f"Failed to resync model instances: {e}")
+
     async def _reconcile(self, event: Event):
         """
         Reconcile the model.
@@ -89,6 +116,7 @@ async def sync_replicas(session: AsyncSession, model: Model):
 
     instances = await ModelInstance.all_by_field(session, "model_id", model.id)
     if len(instances) < model.replicas:
+        to_create = []
         for _ in range(model.replicas - len(instances)):
             name_prefix = ''.join(
                 random.choices(string.ascii_letters + string.digits, k=5)
@@ -103,8 +131,12 @@ async def sync_replicas(session: AsyncSession, model: Model):
                 ollama_library_model_name=model.ollama_library_model_name,
                 state=ModelInstanceStateEnum.PENDING,
             )
-            await ModelInstance.create(session, instance)
-            logger.debug(f"Created model instance for model {model.name}")
+            to_create.append(instance)
+
+        await ModelInstance.bulk_create(session, to_create)
+        logger.debug(
+            f"Created {len(to_create)} model instance(s) for model {instance.model_name}"
+        )
 
     elif len(instances) > model.replicas:
         for instance in instances[model.replicas :]:
@@ -148,6 +180,41 @@ class WorkerController:
                     await self._reconcile(event)
                 except Exception as e:
                     logger.error(f"Failed to reconcile worker: {e}")
+            elif event.type == EventType.RESYNC:
+                try:
+                    await self._resync()
+                except Exception as e:
+                    logger.error(f"Failed to resync workers: {e}")
+
+    async def _resync(self):
+        """
+        Delete instances of workers that are not ready or deleted,
+        their events may have been missed.
+        """
+
+        async with AsyncSession(self._engine) as session:
+            workers = await Worker.all(session)
+            ready_worker_names = {
+                worker.name
+                for worker in workers
+                if worker.state != WorkerStateEnum.NOT_READY
+            }
+
+            instances = [
+                instance
+                for instance in await ModelInstance.all(session)
+                if instance.worker_name
+                and instance.worker_name not in ready_worker_names
+            ]
+            instance_names = [instance.name for instance in instances]
+            for instance in instances:
+                await instance.delete(session)
+
+            if instance_names:
+                logger.debug(
+                    f"Delete instance {', '.join(instance_names)} "
+                    "since their workers are not ready or deleted"
+                )
 
     async def _reconcile(self, event):
         """
@@ -0,0 +1,256 @@
+import json
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from gpustack.schemas.models import (
+    ComputedResourceClaim,
+    Model,
+    ModelInstance,
+    ModelInstanceStateEnum,
+)
+from gpustack.server.bus import EventType, event_bus
+from gpustack.server.db import create_db_and_tables
+
+
+@pytest_asyncio.fixture
+async def session():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    await create_db_and_tables(engine)
+    async with AsyncSession(engine) as session:
+        yield session
+    await engine.dispose()
+
+
+async def create_model(session: AsyncSession, name: str, instances: int = 0):
+    model = await Model.create(
+        session,
+        {
+            "name": name,
+            "source": "ollama_library",
+            "ollama_library_model_name": "llama3",
+        },
+    )
+    model_id = model.id
+    for i in range(instances):
+        await ModelInstance.create(
+            session,
+            {
+                "name": f"{name}-{i}",
+                "model_id": model_id,
+                "model_name": name,
+                "source": "ollama_library",
+                "ollama_library_model_name": "llama3",
+            },
+        )
+    return await Model.one_by_id(session, model_id)
+
+
+def drain(subscriber):
+    events = []
+    while not subscriber.queue.empty():
+        events.append(subscriber.queue.get_nowait())
+    return events
+
+
+@pytest.mark.asyncio
+async def test_update_from_dict(session):
+    model = await create_model(session, "llama3", instances=1)
+    instance = await ModelInstance.first_by_field(session, "model_id", model.id)
+
+    subscriber = event_bus.subscribe("modelinstance")
+    try:
+        await instance.update(
+            session,
+            {"state": "running", "computed_resource_claim": {"memory": 5}},
+        )
+        events = drain(subscriber)
+    finally:
+        event_bus.unsubscribe("modelinstance", subscriber)
+
+    # Assigned values are converted to their column types.
+    assert isinstance(instance.state, ModelInstanceStateEnum)
+    assert instance.state == ModelInstanceStateEnum.RUNNING
+    assert isinstance(instance.computed_resource_claim, ComputedResourceClaim)
+    assert instance.computed_resource_claim.memory == 5
+
+    assert len(events) == 1
+    assert events[0].type == EventType.UPDATED
+    assert events[0].data.computed_resource_claim.memory == 5
+
+    instance.state = "error"
+    await instance.save(session)
+    assert isinstance(instance.state, ModelInstanceStateEnum)
+
+
+@pytest.mark.asyncio
+async def test_delete_all(session):
+    await create_model(session, "llama3", instances=2)
+    await create_model(session, "qwen2", instances=1)
+
+    model_subscriber = event_bus.subscribe("model")
+    instance_subscriber = event_bus.subscribe("modelinstance")
+    try:
+        await Model.delete_all(session)
+        model_events = drain(model_subscriber)
+        instance_events = drain(instance_subscriber)
+    finally:
+        event_bus.unsubscribe("model", model_subscriber)
+        event_bus.unsubscribe("modelinstance", instance_subscriber)
+
+    assert [event.type for event in model_events] == [EventType.DELETED] * 2
+    assert sorted(event.data.name for event in model_events) == ["llama3", "qwen2"]
+
+    assert [event.type for event in instance_events] == [EventType.DELETED] * 3
+    assert sorted(
+        (event.data.name, event.data.model_name) for event in instance_events
+    ) == [("llama3-0", "llama3"), ("llama3-1", "llama3"), ("qwen2-0", "qwen2")]
+
+    assert await Model.count(session) == 0
+    assert await ModelInstance.count(session) == 0
+
+
+@pytest.mark.asyncio
+async def test_delete_cascade(session, monkeypatch):
+    await create_model(session, "llama3", instances=2)
+    await create_model(session, "qwen2", instances=1)
+    model = await Model.one_by_field(session, "name", "llama3")
+
+    published = []
+
+    async def publish(topic, event):
+        published.append((topic, event.type, event.data.name))
+
+    monkeypatch.setattr(event_bus, "publish", publish)
+
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = session.bind.sync_engine
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        await model.delete(session)
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+    # The instances are deleted with a single statement.
+    instance_deletes = [
+        statement
+        for statement in statements
+        if statement.startswith("DELETE FROM model_instances")
+    ]
+    assert len(instance_deletes) == 1
+
+    # Child events are published before the parent's.
+    assert sorted(published[:2]) == [
+        ("modelinstance", EventType.DELETED, "llama3-0"),
+        ("modelinstance", EventType.DELETED, "llama3-1"),
+    ]
+    assert published[2:] == [("model", EventType.DELETED, "llama3")]
+
+    assert await Model.count(session) == 1
+    assert [instance.name for instance in await ModelInstance.all(session)] == [
+        "qwen2-0"
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("window_count", [True, False])
+async def test_paginated_by_query(session, monkeypatch, window_count):
+    monkeypatch.setattr(Model, "__window_count__", window_count)
+    for name in ["llama3", "qwen2", "gemma2"]:
+        await create_model(session, name)
+
+    result = await Model.paginated_by_query(session, page=2, per_page=2)
+    assert [model.name for model in result.items] == ["gemma2"]
+    assert result.pagination.total == 3
+    assert result.pagination.totalPage == 2
+
+    # An out of range page still counts the matching objects.
+    result = await Model.paginated_by_query(session, page=5, per_page=2)
+    assert result.items == []
+    assert result.pagination.total == 3
+    assert result.pagination.totalPage == 2
+
+    result = await Model.paginated_by_query(
+        session, fuzzy_fields={"name": "q"}, page=1, per_page=2
+    )
+    assert [model.name for model in result.items] == ["qwen2"]
+    assert result.pagination.total == 1
+
+    result = await Model.paginated_by_query(session, page=None, per_page=None)
+    assert len(result.items) == 3
+    assert result.pagination.page == 1
+    assert result.pagination.perPage == 3
+    assert result.pagination.total == 3
+    assert result.pagination.totalPage == 1
+
+
+@pytest.mark.asyncio
+async def test_bulk_create(session):
+    model = await create_model(session, "llama3")
+    sources = [
+        {
+            "name": f"llama3-{i}",
+            "model_id": model.id,
+            "model_name": model.name,
+            "source": "ollama_library",
+            "ollama_library_model_name": "llama3",
+        }
+        for i in range(3)
+    ]
+
+    subscriber = event_bus.subscribe("modelinstance")
+    try:
+        instances = await ModelInstance.bulk_create(session, sources)
+        events = drain(subscriber)
+    finally:
+        event_bus.unsubscribe("modelinstance", subscriber)
+
+    assert [instance.name for instance in instances] == [
+        "llama3-0",
+        "llama3-1",
+        "llama3-2",
+    ]
+    assert all(instance.id is not None for instance in instances)
+    assert all(instance.created_at is not None for instance in instances)
+
+    assert [event.type for event in events] == [EventType.CREATED] * 3
+    assert [event.data.id for event in events] == [
+        instance.id for instance in instances
+    ]
+    assert await ModelInstance.count(session) == 3
+
+
+@pytest.mark.asyncio
+async def test_streaming_resync(session, monkeypatch):
+    await create_model(session, "llama3")
+    await create_model(session, "qwen2")
+
+    subscribe = event_bus.subscribe
+    monkeypatch.setattr(
+        event_bus,
+        "subscribe",
+        lambda topic, fields=None: subscribe(topic, fields, maxsize=1),
+    )
+
+    stream = Model.streaming(AsyncSession(session.bind))
+    try:
+        frames = [json.loads(await stream.__anext__()) for _ in range(2)]
+
+        # Overflow the subscriber queue while the stream is not consumed.
+        for model in await Model.all(session):
+            await model.update(session, {"replicas": 2})
+
+        frames += [json.loads(await stream.__anext__()) for _ in range(2)]
+    finally:
+        await stream.aclose()
+
+    # The resync marker is not streamed, the objects are replayed instead.
+    assert [frame["type"] for frame in frames] == [EventType.CREATED.value] * 4
+    assert [frame["data"]["name"] for frame in frames[2:]] == ["llama3", "qwen2"]
+    assert [frame["data"]["replicas"] for frame in frames[2:]] == [2, 2]
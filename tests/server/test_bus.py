@@ -0,0 +1,42 @@
+import pytest
+from gpustack.server.bus import Event, EventBus, EventType
+
+
+@pytest.mark.asyncio
+async def test_publish_overflow_resync():
+    bus = EventBus()
+    slow = bus.subscribe("test", maxsize=2)
+    fast = bus.subscribe("test")
+
+    for i in range(3):
+        await bus.publish("test", Event(type=EventType.UPDATED, data=i))
+
+    # The pending events of the slow subscriber are replaced by a resync marker.
+    assert slow.queue.qsize() == 1
+    event = await slow.receive()
+    assert event.type == EventType.RESYNC
+    assert event.data is None
+
+    assert [(await fast.receive()).data for _ in range(3)] == [0, 1, 2]
+
+    # The slow subscriber receives new events after the marker.
+    await bus.publish("test", Event(type=EventType.DELETED, data=3))
+    event = await slow.receive()
+    assert event.type == EventType.DELETED
+    assert event.data == 3
+
+
+@pytest.mark.asyncio
+async def test_publish_overflow_single_slot():
+    bus = EventBus()
+    slow = bus.subscribe("test", maxsize=1)
+    fast = bus.subscribe("test")
+
+    for i in range(2):
+        await bus.publish("test", Event(type=EventType.UPDATED, data=i))
+
+    assert slow.queue.qsize() == 1
+    assert (await slow.receive()).type == EventType.RESYNC
+
+    # Other subscribers are unaffected by the overflow.
+    assert [(await fast.receive()).data for _ in range(2)] == [0, 1]